@@ -56,6 +56,7 @@ public:
 
     void Stop() {
         running_ = false;
+        wake_cv_.notify_all();
         if (trainer_thread_.joinable()) trainer_thread_.join();
     }
 
@@ -139,7 +140,13 @@ public:
 private:
     void TrainerLoop() {
         while (running_) {
-            compat::this_thread::sleep_for(std::chrono::seconds(5));
+            {
+                // Interruptible wait so Stop() doesn't sit out the interval
+                compat::UniqueLock<compat::Mutex> wake_lock(wake_mu_);
+                wake_cv_.wait_for(wake_lock, std::chrono::seconds(kTrainInterval),
+                                  [this] { return !running_.load(); });
+            }
+            if (!running_) break;
 
             compat::LockGuard<compat::Mutex> lock(mu_);
             size_t count = std::min(telemetry_count_, static_cast<size_t>(kTrainBatchSize));
@@ -181,6 +188,8 @@ private:
     size_t       telemetry_count_;
 
     compat::Mutex mu_;
+    compat::Mutex wake_mu_;
+    compat::CondVar wake_cv_;
     compat::Thread   trainer_thread_;
 };
 
@@ -5,6 +5,7 @@
 
 #include <string>
 #include <vector>
+#include <utility>
 #include <algorithm>
 #include <cctype>
 #include <iostream>
@@ -18,6 +19,7 @@ namespace network {
  * Supported commands:
  *   GET <key>                -> Bulk string or Null
  *   SET <key> <value>        -> +OK
+ *   MSET <key> <value> [...] -> +OK  (one batched backend write)
  *   DEL <key> [key ...]      -> :<count>
  *   EXISTS <key>             -> :0 or :1
  *   KEYS *                   -> Array of bulk strings
@@ -68,6 +70,21 @@ public:
             return {RESPParser::encode_simple_string("OK")};
         }
 
+        if (cmd == "MSET") {
+            if (tokens.size() < 3 || tokens.size() % 2 == 0) {
+                return {RESPParser::encode_error("wrong number of arguments for 'MSET'")};
+            }
+            std::vector<std::pair<std::string, std::string>> entries;
+            entries.reserve((tokens.size() - 1) / 2);
+            for (size_t i = 1; i + 1 < tokens.size(); i += 2) {
+                entries.emplace_back(tokens[i], tokens[i + 1]);
+            }
+            if (!manager_->put_batch(entries)) {
+                return {RESPParser::encode_error("batch write failed")};
+            }
+            return {RESPParser::encode_simple_string("OK")};
+        }
+
         if (cmd == "DEL") {
             if (tokens.size() < 2) return {RESPParser::encode_error("wrong number of arguments for 'DEL'")};
             int64_t count = 0;
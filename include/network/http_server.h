@@ -15,6 +15,7 @@
     using http_socket_t = SOCKET;
     #define HTTP_SOCKET_INVALID INVALID_SOCKET
     #define HTTP_CLOSE_SOCKET(s) closesocket(s)
+    #define HTTP_SHUTDOWN_SOCKET(s) shutdown(s, SD_BOTH)
 #else
     #include <sys/socket.h>
     #include <netinet/in.h>
@@ -23,6 +24,7 @@
     using http_socket_t = int;
     #define HTTP_SOCKET_INVALID (-1)
     #define HTTP_CLOSE_SOCKET(s) close(s)
+    #define HTTP_SHUTDOWN_SOCKET(s) shutdown(s, SHUT_RDWR)
 #endif
 
 #include <algorithm>
@@ -70,9 +72,18 @@ public:
         accept_thread_ = compat::Thread(&HTTPServer::acceptLoop, this);
     }
 
+    /** Async-signal-safe counterpart of stop(): wakes accept() without joining. */
+    void request_stop() {
+        running_ = false;
+        http_socket_t s = listen_sock_;
+        if (s != HTTP_SOCKET_INVALID) HTTP_SHUTDOWN_SOCKET(s);
+    }
+
     void stop() {
         running_ = false;
         if (listen_sock_ != HTTP_SOCKET_INVALID) {
+            // close() alone doesn't wake a thread blocked in accept() on Linux
+            HTTP_SHUTDOWN_SOCKET(listen_sock_);
             HTTP_CLOSE_SOCKET(listen_sock_);
             listen_sock_ = HTTP_SOCKET_INVALID;
         }
@@ -38,7 +38,15 @@ public:
     }
 
     static std::string encode_bulk_string(const std::string& s) {
-        return "$" + std::to_string(s.size()) + "\r\n" + s + "\r\n";
+        std::string len = std::to_string(s.size());
+        std::string out;
+        out.reserve(1 + len.size() + 2 + s.size() + 2);  // one allocation per reply
+        out += '$';
+        out += len;
+        out += "\r\n";
+        out += s;
+        out += "\r\n";
+        return out;
     }
 
     static std::string encode_null() {
@@ -65,20 +73,31 @@ public:
      *   - Inline commands ("SET name Gemini\r\n") from telnet / redis-cli inline.
      */
     static std::vector<std::string> parse(const std::string& buf, size_t& bytes_consumed) {
+        return parse(buf, 0, bytes_consumed);
+    }
+
+    /**
+     * Parse the message starting at `start`, so a pipelined buffer can be
+     * walked without erasing each consumed command from its front.
+     * `bytes_consumed` is relative to `start`.
+     */
+    static std::vector<std::string> parse(const std::string& buf, size_t start,
+                                          size_t& bytes_consumed) {
         bytes_consumed = 0;
-        if (buf.empty()) return {};
+        if (start >= buf.size()) return {};
 
-        if (buf[0] == '*') {
-            return parse_array(buf, bytes_consumed);
+        if (buf[start] == '*') {
+            return parse_array(buf, start, bytes_consumed);
         } else {
-            return parse_inline(buf, bytes_consumed);
+            return parse_inline(buf, start, bytes_consumed);
         }
     }
 
 private:
     /** Parse a RESP array: *N\r\n followed by N bulk strings. */
-    static std::vector<std::string> parse_array(const std::string& buf, size_t& consumed) {
-        size_t pos = 1;  // skip '*'
+    static std::vector<std::string> parse_array(const std::string& buf, size_t start,
+                                                size_t& consumed) {
+        size_t pos = start + 1;  // skip '*'
         auto crlf = buf.find("\r\n", pos);
         if (crlf == std::string::npos) return {};
 
@@ -117,26 +136,27 @@ private:
             pos = data_start + len + 2;  // skip trailing \r\n
         }
 
-        consumed = pos;
+        consumed = pos - start;
         return tokens;
     }
 
     /** Parse an inline command: "SET name Gemini\r\n" */
-    static std::vector<std::string> parse_inline(const std::string& buf, size_t& consumed) {
-        auto crlf = buf.find("\r\n");
+    static std::vector<std::string> parse_inline(const std::string& buf, size_t start,
+                                                 size_t& consumed) {
+        auto crlf = buf.find("\r\n", start);
         std::string line;
         if (crlf != std::string::npos) {
-            line = buf.substr(0, crlf);
-            consumed = crlf + 2;
+            line = buf.substr(start, crlf - start);
+            consumed = crlf + 2 - start;
         } else {
             // Also accept LF-only or unterminated (for telnet)
-            auto lf = buf.find('\n');
+            auto lf = buf.find('\n', start);
             if (lf != std::string::npos) {
-                line = buf.substr(0, lf);
-                consumed = lf + 1;
+                line = buf.substr(start, lf - start);
+                consumed = lf + 1 - start;
             } else {
-                line = buf;
-                consumed = buf.size();
+                line = buf.substr(start);
+                consumed = buf.size() - start;
             }
         }
 
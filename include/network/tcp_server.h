@@ -11,6 +11,7 @@
     using socket_t = SOCKET;
     #define SOCKET_INVALID INVALID_SOCKET
     #define CLOSE_SOCKET(s) closesocket(s)
+    #define SHUTDOWN_SOCKET(s) shutdown(s, SD_BOTH)
 #else
     #include <sys/socket.h>
     #include <netinet/in.h>
@@ -19,6 +20,7 @@
     using socket_t = int;
     #define SOCKET_INVALID (-1)
     #define CLOSE_SOCKET(s) close(s)
+    #define SHUTDOWN_SOCKET(s) shutdown(s, SHUT_RDWR)
 #endif
 
 #include "client_handler.h"
@@ -28,6 +30,7 @@
 
 #include <string>
 #include <vector>
+#include <set>
 #include <iostream>
 #include <functional>
 #include <cstring>
@@ -72,14 +75,34 @@ public:
         accept_loop();
     }
 
+    /**
+     * Async-signal-safe: flag the accept loop and wake it, so start()
+     * returns. Takes no locks; the caller runs stop() afterwards from a
+     * normal thread to close fds and join clients.
+     */
+    void request_stop() {
+        running_ = false;
+        socket_t fd = listen_fd_;
+        if (fd != SOCKET_INVALID) SHUTDOWN_SOCKET(fd);
+    }
+
     /** Signal the server to stop accepting new connections. */
     void stop() {
         running_ = false;
         if (listen_fd_ != SOCKET_INVALID) {
+            // close() alone doesn't wake a thread blocked in accept() on Linux
+            SHUTDOWN_SOCKET(listen_fd_);
             CLOSE_SOCKET(listen_fd_);
             listen_fd_ = SOCKET_INVALID;
         }
 
+        // Wake client threads blocked in recv() so the joins below can't
+        // hang on an idle connection
+        {
+            compat::LockGuard<compat::Mutex> lock(fds_mu_);
+            for (auto fd : client_fds_) SHUTDOWN_SOCKET(fd);
+        }
+
         // Join all client threads
         compat::LockGuard<compat::Mutex> lock(threads_mu_);
         for (auto& t : client_threads_) {
@@ -160,9 +183,15 @@ private:
             }
 
             client_count_++;
+            {
+                compat::LockGuard<compat::Mutex> lock(fds_mu_);
+                client_fds_.insert(client_fd);
+            }
             std::string ip = inet_ntoa(client_addr.sin_addr);
-            std::cout << "[TCP] Client connected: " << ip
-                      << ":" << ntohs(client_addr.sin_port) << "\n";
+            // One pre-built string per line: a single stream write, so lines
+            // from concurrent client threads never interleave mid-line
+            std::cout << ("[TCP] Client connected: " + ip + ":" +
+                          std::to_string(ntohs(client_addr.sin_port)) + "\n");
 
             // Spawn a thread for this client
             compat::LockGuard<compat::Mutex> lock(threads_mu_);
@@ -175,6 +204,7 @@ private:
     void handle_client(socket_t fd, std::string ip) {
         ClientHandler handler(manager_);
         std::string buffer;
+        std::string out;  // reply batch; capacity is reused across reads
         char recv_buf[4096];
 
         while (running_) {
@@ -187,31 +217,50 @@ private:
 
             buffer.append(recv_buf, n);
 
-            // Process all complete commands in the buffer
-            while (!buffer.empty()) {
+            // Process all complete commands in the buffer and answer the
+            // whole pipelined batch with a single send.
+            out.clear();
+            size_t offset = 0;
+            bool quit = false;
+            while (offset < buffer.size()) {
                 size_t consumed = 0;
-                auto tokens = RESPParser::parse(buffer, consumed);
+                auto tokens = RESPParser::parse(buffer, offset, consumed);
 
-                if (tokens.empty() || consumed == 0) break;  // need more data
+                if (consumed == 0) break;  // need more data
+                offset += consumed;
+                if (tokens.empty()) continue;  // blank inline line
 
                 auto response = handler.execute(tokens);
-
-                // Send response
-                send_all(fd, response.data);
-
-                // Remove consumed bytes
-                buffer.erase(0, consumed);
+                out += response.data;
 
                 if (response.close_connection) {
-                    CLOSE_SOCKET(fd);
-                    std::cout << "[TCP] Client disconnected (QUIT): " << ip << "\n";
-                    return;
+                    quit = true;
+                    break;
                 }
             }
+
+            // Remove consumed bytes
+            buffer.erase(0, offset);
+            if (!out.empty()) send_all(fd, out);
+
+            if (quit) {
+                close_client(fd);
+                std::cout << ("[TCP] Client disconnected (QUIT): " + ip + "\n");
+                return;
+            }
         }
 
+        close_client(fd);
+        std::cout << ("[TCP] Client disconnected: " + ip + "\n");
+    }
+
+    /** Forget the fd before closing it so stop() never touches a reused fd. */
+    void close_client(socket_t fd) {
+        {
+            compat::LockGuard<compat::Mutex> lock(fds_mu_);
+            client_fds_.erase(fd);
+        }
         CLOSE_SOCKET(fd);
-        std::cout << "[TCP] Client disconnected: " << ip << "\n";
     }
 
     void send_all(socket_t fd, const std::string& data) {
@@ -236,6 +285,8 @@ private:
     compat::Atomic<uint32_t> client_count_;
     std::vector<compat::Thread> client_threads_;
     compat::Mutex threads_mu_;
+    std::set<socket_t> client_fds_;  // open client sockets, for stop()
+    compat::Mutex fds_mu_;
 };
 
 }  // namespace network
@@ -8,6 +8,13 @@
 #include <fstream>
 #include <sstream>
 
+#ifdef _WIN32
+#include <direct.h>
+#else
+#include <sys/stat.h>
+#include <sys/types.h>
+#endif
+
 namespace dcs {
 namespace persistence {
 
@@ -103,12 +110,20 @@ private:
         if (pos == std::string::npos) return;
         std::string dir = filepath.substr(0, pos);
         if (dir.empty()) return;
+
+        // mkdir -p via direct syscalls: this runs on every write-through
+        // store, so spawning a shell here meant a fork+exec per SET.
+        // Already-existing components just fail with EEXIST.
+        for (size_t i = 1; i <= dir.size(); ++i) {
+            if (i == dir.size() || dir[i] == '/' || dir[i] == '\\') {
+                std::string prefix = dir.substr(0, i);
 #ifdef _WIN32
-        std::string cmd = "mkdir \"" + dir + "\" 2>nul";
+                _mkdir(prefix.c_str());
 #else
-        std::string cmd = "mkdir -p \"" + dir + "\"";
+                mkdir(prefix.c_str(), 0755);
 #endif
-        system(cmd.c_str());
+            }
+        }
     }
 
     std::string filepath_;
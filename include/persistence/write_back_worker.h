@@ -80,8 +80,8 @@ public:
             offset = end;
         }
         flush_count_.fetch_add(1);
-        std::cout << "[WriteBack] Flushed " << dirty.size()
-                  << " dirty entries to disk.\n";
+        std::cout << ("[WriteBack] Flushed " + std::to_string(dirty.size()) +
+                      " dirty entries to disk.\n");
     }
 
     /** Trigger an out-of-cycle flush (e.g. dirty set size exceeded). */
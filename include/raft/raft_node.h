@@ -311,13 +311,15 @@ private:
                     votes_received_++;
                     if (votes_received_ >= majority) {
                         BecomeLeader();
-                        return;
+                        break;
                     }
                 }
             } catch (...) {
                 // Peer unreachable — continue
             }
         }
+        // Announce leadership immediately, outside mu_ (SendHeartbeats locks it)
+        if (IsLeader()) SendHeartbeats();
     }
 
     void SendHeartbeats() {
@@ -394,8 +396,6 @@ private:
             next_index_[i]  = log_.LastIndex() + 1;
             match_index_[i] = 0;
         }
-        // Immediately send heartbeats
-        SendHeartbeats();
     }
 
     void ResetElectionTimer() {
@@ -7,6 +7,8 @@
 
 #include <string>
 #include <memory>
+#include <vector>
+#include <utility>
 #include <iostream>
 #include <chrono>
 
@@ -108,6 +110,36 @@ public:
         }
     }
 
+    /**
+     * PUT (batch) — Same semantics as put() for every pair, but in
+     * Write-Through mode the backend receives one batch_store() call so the
+     * WAL is synced once per batch instead of once per key.
+     */
+    bool put_batch(const std::vector<std::pair<std::string, std::string>>& entries) {
+        if (config_.write_mode == WriteMode::WriteBack) {
+            for (size_t i = 0; i < entries.size(); ++i) {
+                put_write_back(entries[i].first, entries[i].second);
+            }
+            return true;
+        }
+
+        for (size_t i = 0; i < entries.size(); ++i) {
+            cache_.put(entries[i].first, entries[i].second);
+        }
+        if (backend_) {
+            if (!backend_->batch_store(entries)) {
+                std::cerr << "[WriteThrough] DB batch write failed ("
+                          << entries.size() << " keys)\n";
+                return false;
+            }
+            for (size_t i = 0; i < entries.size(); ++i) {
+                cache_.clear_dirty(entries[i].first);
+            }
+        }
+        stats_.write_through_count.fetch_add(entries.size());
+        return true;
+    }
+
     /**
      * DELETE — Remove from cache AND backend.
      */
@@ -171,7 +203,7 @@ private:
         if (backend_) {
             bool ok = backend_->store(key, value);
             if (!ok) {
-                std::cerr << "[WriteThrough] DB write failed for key: " << key << "\n";
+                std::cerr << ("[WriteThrough] DB write failed for key: " + key + "\n");
                 return false;
             }
             cache_.clear_dirty(key);  // persisted successfully
@@ -28,6 +28,10 @@
 #include <thread>
 #include <deque>
 #include <fstream>
+#include <random>
+#include <vector>
+#include <memory>
+#include <algorithm>
 #ifdef _WIN32
 #include <io.h>
 #endif
@@ -37,12 +41,14 @@ static dcs::compat::Atomic<bool> g_shutdown{false};
 static dcs::network::TCPServer*  g_tcp_server  = nullptr;
 static dcs::network::HTTPServer* g_http_server = nullptr;
 
+// Only async-signal-safe work here: the signal can land on a thread that
+// holds a server mutex or stdout's lock. The main thread does the real
+// teardown once tcp_server.start() returns.
 void signal_handler(int sig) {
     (void)sig;
-    std::cout << "\n[Main] Caught interrupt signal — shutting down...\n";
     g_shutdown = true;
-    if (g_tcp_server)  g_tcp_server->stop();
-    if (g_http_server) g_http_server->stop();
+    if (g_tcp_server)  g_tcp_server->request_stop();
+    if (g_http_server) g_http_server->request_stop();
 }
 
 // ── Event Log ─────────────────────────────────────────────────────────
@@ -68,6 +74,31 @@ static void push_event(const std::string& type, const std::string& msg) {
     while (g_events.size() > MAX_EVENTS) g_events.pop_front();
 }
 
+// ── Raft helpers ──────────────────────────────────────────────────────
+// Poll until some node is leader for a term >= `min_term`, backing off with
+// jitter between checks. Returns the leader id, or -1 once `deadline` passes.
+static int wait_for_leader(const std::vector<std::unique_ptr<dcs::raft::RaftNode>>& nodes,
+                           std::chrono::milliseconds deadline, uint64_t min_term = 0) {
+    // Per call: /api/election runs this on concurrent HTTP request threads
+    std::mt19937 rng(std::random_device{}());
+    std::uniform_real_distribution<double> jitter(0.5, 1.5);
+
+    auto start = std::chrono::steady_clock::now();
+    for (int attempt = 0;; ++attempt) {
+        for (size_t i = 0; i < nodes.size(); i++) {
+            auto st = nodes[i]->GetState();
+            if (st.role == dcs::raft::RaftRole::Leader && st.term >= min_term) {
+                return static_cast<int>(i);
+            }
+        }
+        if (std::chrono::steady_clock::now() - start >= deadline) return -1;
+
+        double delay_ms = std::min(200.0, 10.0 * static_cast<double>(1 << std::min(attempt, 5)));
+        dcs::compat::this_thread::sleep_for(
+            std::chrono::milliseconds(static_cast<int>(delay_ms * jitter(rng))));
+    }
+}
+
 // ── Traffic Generator ─────────────────────────────────────────────────
 static dcs::compat::Atomic<int>  g_traffic_rate{0};   // ops/sec (0 = stopped)
 static dcs::compat::Atomic<bool> g_traffic_running{false};
@@ -108,14 +139,27 @@ struct ServerConfig {
     int         cluster_size     = 5;
 };
 
+// Parse a TCP port once, rejecting anything atoi() would silently turn into
+// port 0 or truncate (e.g. "abc", "80x", "70000").
+static uint16_t parse_port(const std::string& flag, const char* text) {
+    char* end = nullptr;
+    long port = std::strtol(text, &end, 10);
+    if (end == text || *end != '\0' || port < 1 || port > 65535) {
+        std::cerr << "Invalid value for " << flag << ": '" << text
+                  << "' (expected a port in 1-65535)\n";
+        std::exit(1);
+    }
+    return static_cast<uint16_t>(port);
+}
+
 ServerConfig parse_args(int argc, char* argv[]) {
     ServerConfig cfg;
     for (int i = 1; i < argc; ++i) {
         std::string arg = argv[i];
         if ((arg == "--port" || arg == "-p") && i + 1 < argc)
-            cfg.port = static_cast<uint16_t>(std::atoi(argv[++i]));
+            cfg.port = parse_port(arg, argv[++i]);
         else if (arg == "--http-port" && i + 1 < argc)
-            cfg.http_port = static_cast<uint16_t>(std::atoi(argv[++i]));
+            cfg.http_port = parse_port(arg, argv[++i]);
         else if ((arg == "--capacity" || arg == "-c") && i + 1 < argc)
             cfg.capacity = static_cast<size_t>(std::atoll(argv[++i]));
         else if ((arg == "--mode" || arg == "-m") && i + 1 < argc) {
@@ -252,8 +296,10 @@ int main(int argc, char* argv[]) {
         }
     });
     for (int i = 0; i < RAFT_CLUSTER_SIZE; i++) raft_nodes[i]->Start();
-    // Allow initial leader election
-    dcs::compat::this_thread::sleep_for(std::chrono::milliseconds(500));
+    // Wait for the initial leader election instead of a fixed sleep
+    if (wait_for_leader(raft_nodes, std::chrono::milliseconds(2000)) < 0) {
+        std::cout << "[Init] No Raft leader elected yet — continuing startup\n";
+    }
     for (int i = 0; i < RAFT_CLUSTER_SIZE; i++) {
         auto st = raft_nodes[i]->GetState();
         push_event("raft", "Node " + std::to_string(i) + " started as " +
@@ -462,7 +508,7 @@ int main(int argc, char* argv[]) {
             }
         }
         g_traffic_rate = rate;
-        std::cout << "[API] Traffic rate set to " << rate << " ops/s\n";
+        std::cout << ("[API] Traffic rate set to " + std::to_string(rate) + " ops/s\n");
         push_event("info", "Traffic rate set to " + std::to_string(rate) + " ops/s");
         return "{\"status\":\"ok\",\"rate\":" + std::to_string(rate) + "}";
     });
@@ -571,7 +617,8 @@ int main(int argc, char* argv[]) {
     http_server.addEndpoint("/api/flush", [&](const std::string&) -> std::string {
         manager.flush();
         g_flush_count.fetch_add(1);
-        std::cout << "[API] Flush triggered — flush_count=" << g_flush_count.load() << "\n";
+        std::cout << ("[API] Flush triggered — flush_count=" +
+                      std::to_string(g_flush_count.load()) + "\n");
         push_event("lsm", "Manual flush triggered — data persisted to SSTables");
         return "{\"status\":\"ok\",\"flush_count\":" + std::to_string(g_flush_count.load()) + "}";
     });
@@ -590,24 +637,14 @@ int main(int argc, char* argv[]) {
         int trigger_node = (old_leader + 1) % RAFT_CLUSTER_SIZE;
         auto old_state = raft_nodes[trigger_node]->GetState();
         raft_nodes[trigger_node]->TriggerElection();
-        // Brief wait for election to complete
-        dcs::compat::this_thread::sleep_for(std::chrono::milliseconds(200));
-        // Find new leader
-        int new_leader = -1;
-        uint64_t new_term = 0;
-        std::string new_role;
-        for (int i = 0; i < RAFT_CLUSTER_SIZE; i++) {
-            auto st = raft_nodes[i]->GetState();
-            if (st.role == dcs::raft::RaftRole::Leader) {
-                new_leader = i;
-                new_term = st.term;
-                new_role = dcs::raft::RoleToString(st.role);
-            }
-        }
-        std::cout << "[API] Election triggered on Node " << trigger_node
-                  << " — old_term=" << old_state.term
-                  << " new_term=" << new_term
-                  << " leader=Node " << new_leader << "\n";
+        // Wait until a leader for the new term shows up (or give up)
+        int new_leader = wait_for_leader(raft_nodes, std::chrono::milliseconds(1000),
+                                         old_state.term + 1);
+        uint64_t new_term = (new_leader >= 0) ? raft_nodes[new_leader]->GetState().term : 0;
+        std::cout << ("[API] Election triggered on Node " + std::to_string(trigger_node) +
+                      " — old_term=" + std::to_string(old_state.term) +
+                      " new_term=" + std::to_string(new_term) +
+                      " leader=Node " + std::to_string(new_leader) + "\n");
         push_event("raft", "Manual election on Node " + std::to_string(trigger_node) +
                    " (term " + std::to_string(old_state.term) +
                    " → " + std::to_string(new_term) + ") — Leader: Node " +
@@ -624,8 +661,9 @@ int main(int argc, char* argv[]) {
     http_server.addEndpoint("/api/compact", [&](const std::string&) -> std::string {
         lsm_storage.ForceCompaction();
         auto& s = lsm_storage.Stats();
-        std::cout << "[API] Compaction triggered — compactions=" << s.compactions_done.load()
-                  << " sstables=" << s.sstable_count.load() << "\n";
+        std::cout << ("[API] Compaction triggered — compactions=" +
+                      std::to_string(s.compactions_done.load()) +
+                      " sstables=" + std::to_string(s.sstable_count.load()) + "\n");
         push_event("lsm", "Manual compaction triggered");
         return "{\"status\":\"ok\",\"compactions\":" + std::to_string(s.compactions_done.load()) +
                ",\"sstable_count\":" + std::to_string(s.sstable_count.load()) + "}";
@@ -671,7 +709,10 @@ int main(int argc, char* argv[]) {
                 float latency = (seg_ops[shard] > 0) ? 0.2f + 0.8f * ops_load : 0.1f;
                 sharder.RecordTelemetry(shard, load, hit_rate, latency);
             }
-            dcs::compat::this_thread::sleep_for(std::chrono::seconds(2));
+            // 2 s period in short slices so shutdown doesn't wait out a full sleep
+            for (int i = 0; i < 20 && !g_shutdown.load(); i++) {
+                dcs::compat::this_thread::sleep_for(std::chrono::milliseconds(100));
+            }
         }
     });
 
@@ -692,11 +733,13 @@ int main(int argc, char* argv[]) {
             }
             int inten = g_burst_intensity.load();
             int ns = g_burst_shard_count.load();
-            // Do one round of burst ops
+            // Do one round of burst ops (round suffix and value are per-round)
+            const std::string round_str = std::to_string(burst_round);
+            const std::string bval = "bv" + round_str;
             for (int i = 0; i < ns; i++) {
                 int s = g_burst_shards_list[i];
-                std::string bkey = "burst_s" + std::to_string(s) + "_" + std::to_string(burst_round);
-                manager.put(bkey, "bv" + std::to_string(burst_round));
+                std::string bkey = "burst_s" + std::to_string(s) + "_" + round_str;
+                manager.put(bkey, bval);
                 g_seg_locks[s].fetch_add(1);
                 g_seg_ops_window[s].fetch_add(1);
                 g_seg_ops_pinn[s].fetch_add(1);
@@ -732,9 +775,20 @@ int main(int argc, char* argv[]) {
             const int BATCH_MS = 100;
             int ops_per_batch = std::max(1, worker_rate * BATCH_MS / 1000);
 
+            // Reserve this batch's key numbers up front so workers don't
+            // serialize on the shared counter once per op
+            uint64_t kn_base = traffic_key_counter.fetch_add(
+                static_cast<uint64_t>(ops_per_batch));
+
+            // Per-batch local tallies, published once after the batch so the
+            // hot loop doesn't bounce shared counter cache lines between workers
+            uint64_t batch_seg_ops[32] = {};
+            uint64_t batch_node_reqs[5] = {};
+            uint64_t batch_ops = 0;
+
             auto batch_start = std::chrono::steady_clock::now();
             for (int b = 0; b < ops_per_batch && !g_shutdown.load(); b++) {
-                uint64_t kn = traffic_key_counter.fetch_add(1);
+                uint64_t kn = kn_base + static_cast<uint64_t>(b);
                 local_counter++;
                 int shard_idx;
                 int op = static_cast<int>(kn % 7);
@@ -755,12 +809,10 @@ int main(int argc, char* argv[]) {
 
                 // Route to one of 5 raft nodes
                 int node_idx = shard_idx * 5 / 32;
-                g_node_reqs[node_idx].fetch_add(1);
+                batch_node_reqs[node_idx]++;
 
                 // Track lock usage and PINN telemetry
-                g_seg_locks[shard_idx].fetch_add(1);
-                g_seg_ops_window[shard_idx].fetch_add(1);
-                g_seg_ops_pinn[shard_idx].fetch_add(1);
+                batch_seg_ops[shard_idx]++;
 
                 try {
                     if (op <= 2) {
@@ -781,9 +833,20 @@ int main(int argc, char* argv[]) {
                     // Prevent thread death from Raft or cache exceptions
                 }
 
-                g_traffic_total.fetch_add(1);
+                batch_ops++;
             }
 
+            for (int i = 0; i < 32; i++) {
+                if (batch_seg_ops[i] == 0) continue;
+                g_seg_locks[i].fetch_add(batch_seg_ops[i]);
+                g_seg_ops_window[i].fetch_add(batch_seg_ops[i]);
+                g_seg_ops_pinn[i].fetch_add(batch_seg_ops[i]);
+            }
+            for (int i = 0; i < 5; i++) {
+                if (batch_node_reqs[i] > 0) g_node_reqs[i].fetch_add(batch_node_reqs[i]);
+            }
+            g_traffic_total.fetch_add(batch_ops);
+
             // ── Burst / heat stroke detection (only worker 0 handles this) ──
             if (worker_id == 0 && local_counter % 2000 < static_cast<uint64_t>(ops_per_batch)) {
                 uint64_t seg_ops[32];
@@ -805,14 +868,14 @@ int main(int argc, char* argv[]) {
                         g_burst_cooldown.fetch_add(-1);
                     } else if (hot_count >= 2) {
                         g_flush_count.fetch_add(1);
-                        std::cout << "[Burst] Detected: " << hot_count << " hot shards\n";
+                        std::cout << ("[Burst] Detected: " + std::to_string(hot_count) + " hot shards\n");
                         push_event("burst", "Burst detected: " +
                                    std::to_string(hot_count) + " hot shards (>" +
                                    std::to_string(static_cast<int>(avg_ops * 2.5)) +
                                    " ops) — triggering write-back flush");
                         if (hot_count >= 4) {
                             g_heatstroke_count.fetch_add(1);
-                            std::cout << "[Burst] HEAT STROKE! " << hot_count << " shards overloaded\n";
+                            std::cout << ("[Burst] HEAT STROKE! " + std::to_string(hot_count) + " shards overloaded\n");
                             push_event("burst", "HEAT STROKE! " +
                                        std::to_string(hot_count) +
                                        " shards overloaded — emergency flush to DB");
@@ -848,7 +911,8 @@ int main(int argc, char* argv[]) {
                     if (rs.role == dcs::raft::RaftRole::Leader) {
                         std::string cur_role = "Leader(" + std::to_string(ni) + ")";
                         if (cur_role != prev_raft_role) {
-                            std::cout << "[Raft] Leader changed to Node " << ni << " (term " << rs.term << ")\n";
+                            std::cout << ("[Raft] Leader changed to Node " + std::to_string(ni) +
+                                          " (term " + std::to_string(rs.term) + ")\n");
                             push_event("raft", "Leader changed to Node " + std::to_string(ni) +
                                        " (term " + std::to_string(rs.term) + ")");
                             prev_raft_role = cur_role;
@@ -879,10 +943,14 @@ int main(int argc, char* argv[]) {
         });
     }
 
-    tcp_server.start();  // Blocks until stop() is called
+    tcp_server.start();  // Blocks until a signal calls request_stop()
 
     // ── 8. Graceful Shutdown ──────────────────────────────────────────
+    if (g_shutdown.load()) {
+        std::cout << "\n[Main] Caught interrupt signal — shutting down...\n";
+    }
     g_shutdown = true;
+    tcp_server.stop();
     g_traffic_rate = 0;
     std::cout << "\n[Shutdown] Stopping subsystems...\n";
 
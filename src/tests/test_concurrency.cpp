@@ -142,16 +142,25 @@ TEST(test_stress_mixed_operations) {
     dcs::cache::SegmentedCache cache(2048);
     const int N_THREADS = 16;
     const int N_OPS = 5000;
+    const int N_KEYS = 3000;
+
+    // Build keys and values before timing so the measurement is the cache,
+    // not string formatting
+    std::vector<std::string> keys, values;
+    keys.reserve(N_KEYS);
+    for (int k = 0; k < N_KEYS; ++k) keys.push_back("stress_" + std::to_string(k));
+    values.reserve(N_OPS);
+    for (int i = 0; i < N_OPS; ++i) values.push_back("v" + std::to_string(i));
 
     auto start = std::chrono::steady_clock::now();
 
     std::vector<Thread> threads;
     for (int t = 0; t < N_THREADS; ++t) {
-        threads.push_back(Thread([&cache, t, N_OPS]() {
+        threads.push_back(Thread([&cache, &keys, &values, t, N_OPS, N_KEYS]() {
             for (int i = 0; i < N_OPS; ++i) {
-                std::string key = "stress_" + std::to_string((t * N_OPS + i) % 3000);
+                const std::string& key = keys[(t * N_OPS + i) % N_KEYS];
                 switch (i % 3) {
-                    case 0: cache.put(key, "v" + std::to_string(i)); break;
+                    case 0: cache.put(key, values[i]); break;
                     case 1: cache.get(key); break;
                     case 2: cache.del(key); break;
                 }
@@ -162,11 +171,11 @@ TEST(test_stress_mixed_operations) {
     for (size_t i = 0; i < threads.size(); ++i) threads[i].join();
 
     auto elapsed = std::chrono::steady_clock::now() - start;
-    long long ms = std::chrono::duration_cast<std::chrono::milliseconds>(elapsed).count();
+    long long ns = std::chrono::duration_cast<std::chrono::nanoseconds>(elapsed).count();
     long long total_ops = (long long)N_THREADS * N_OPS;
 
-    std::cout << "    " << total_ops << " ops in " << ms << " ms ("
-              << (ms > 0 ? total_ops * 1000 / ms : 0) << " ops/sec)\n";
+    std::cout << "    " << total_ops << " ops in " << ns / 1000000 << " ms ("
+              << (ns > 0 ? total_ops * 1000000000LL / ns : 0) << " ops/sec)\n";
 }
 
 // ══════════════════════════════════════════════════════════════════════
@@ -65,6 +65,41 @@ TEST(test_parse_resp_get) {
     assert(tokens[1] == "name");
 }
 
+TEST(test_parse_pipelined_buffer) {
+    std::string msg = "*2\r\n$3\r\nGET\r\n$1\r\na\r\nSET b 2\r\nPING\r\n";
+    size_t offset = 0, consumed = 0;
+
+    auto first = RESPParser::parse(msg, offset, consumed);
+    assert(first.size() == 2 && first[0] == "GET" && first[1] == "a");
+    offset += consumed;
+
+    auto second = RESPParser::parse(msg, offset, consumed);
+    assert(second.size() == 3 && second[0] == "SET" && second[2] == "2");
+    offset += consumed;
+
+    auto third = RESPParser::parse(msg, offset, consumed);
+    assert(third.size() == 1 && third[0] == "PING");
+    offset += consumed;
+    assert(offset == msg.size());
+}
+
+TEST(test_parse_incomplete_array) {
+    std::string msg = "*2\r\n$3\r\nGET\r\n$4\r\nna";
+    size_t consumed = 0;
+    auto tokens = RESPParser::parse(msg, consumed);
+    assert(tokens.empty());
+    assert(consumed == 0);
+}
+
+TEST(test_encode_command_round_trip) {
+    std::vector<std::string> args = {"SET", "greeting", "hello world"};
+    std::string wire = RESPParser::encode_array(args);
+    size_t consumed = 0;
+    auto tokens = RESPParser::parse(wire, consumed);
+    assert(tokens == args);
+    assert(consumed == wire.size());
+}
+
 TEST(test_encode_simple_string) {
     assert(RESPParser::encode_simple_string("OK") == "+OK\r\n");
 }
@@ -140,6 +175,31 @@ TEST(test_handler_del) {
 #endif
 }
 
+TEST(test_handler_mset) {
+    std::string test_file = "test_data/handler_mset.dat";
+    dcs::persistence::FileStorage storage(test_file);
+    dcs::sync::CacheManager::Config cfg;
+    cfg.write_mode = dcs::sync::WriteMode::WriteThrough;
+    dcs::sync::CacheManager manager(cfg, &storage);
+    ClientHandler handler(&manager);
+
+    auto resp = handler.execute({"MSET", "a", "1", "b", "2", "c", "3"});
+    assert(resp.data == "+OK\r\n");
+    assert(handler.execute({"GET", "b"}).data == "$1\r\n2\r\n");
+    assert(storage.load("c").found);
+    assert(manager.stats().write_through_count.load() == 3);
+
+    resp = handler.execute({"MSET", "a", "1", "b"});
+    assert(resp.data.find("-ERR") == 0);
+
+    manager.shutdown();
+#ifdef _WIN32
+    system("rmdir /s /q test_data 2>nul");
+#else
+    system("rm -rf test_data");
+#endif
+}
+
 TEST(test_handler_exists) {
     std::string test_file = "test_data/handler_exists.dat";
     dcs::persistence::FileStorage storage(test_file);
@@ -0,0 +1,308 @@
+/**
+ * Hot-key storm load generator — hammers a single key over pipelined,
+ * non-blocking connections to measure the server's GET throughput ceiling.
+ *
+ * Run the server first: distributed_cache.exe --port 6399
+ * Then run:             bench_hot_key.exe [host] [port] [total_ops] [connections] [key] [timeout_s]
+ * (defaults: 127.0.0.1 6399 100000 4 hot_key 30)
+ *
+ * One thread drives every connection through poll(); each connection keeps
+ * up to kInFlightPerConn GETs outstanding, so the client never waits a full
+ * round trip per command.
+ */
+
+#ifdef _WIN32
+    #ifndef WIN32_LEAN_AND_MEAN
+        #define WIN32_LEAN_AND_MEAN
+    #endif
+    #include <winsock2.h>
+    #include <ws2tcpip.h>
+    #pragma comment(lib, "Ws2_32.lib")
+    using socket_t = SOCKET;
+    #define SOCKET_INVALID INVALID_SOCKET
+    #define CLOSE_SOCKET(s) closesocket(s)
+    #define POLL_FN WSAPoll
+#else
+    #include <sys/socket.h>
+    #include <netinet/in.h>
+    #include <netinet/tcp.h>
+    #include <arpa/inet.h>
+    #include <netdb.h>
+    #include <fcntl.h>
+    #include <poll.h>
+    #include <unistd.h>
+    #include <cerrno>
+    using socket_t = int;
+    #define SOCKET_INVALID (-1)
+    #define CLOSE_SOCKET(s) close(s)
+    #define POLL_FN poll
+#endif
+
+#include <iostream>
+#include <string>
+#include <cstdlib>
+#include <vector>
+#include <chrono>
+#include <algorithm>
+
+#include "include/network/resp_parser.h"
+
+using dcs::network::RESPParser;
+
+static const int kInFlightPerConn = 64;
+
+/**
+ * ReplyScanner — counts complete replies straight out of each recv()
+ * chunk, so reply bytes are never copied into a per-connection buffer.
+ * Resumes mid-reply when a bulk string is split across reads.
+ */
+struct ReplyScanner {
+    enum State { Type, Header, Body };
+    State    state = Type;
+    char     kind = 0;       // leading RESP byte of the current reply
+    bool     negative = false;
+    uint64_t len = 0;        // bulk length parsed from the header
+    uint64_t body_left = 0;  // payload + CRLF still to skip
+
+    /** Consume `n` bytes; returns how many replies they completed. */
+    int feed(const char* p, size_t n, uint64_t& errors) {
+        int replies = 0;
+        size_t i = 0;
+        while (i < n) {
+            if (state == Body) {
+                size_t skip = static_cast<size_t>(std::min<uint64_t>(body_left, n - i));
+                body_left -= skip;
+                i += skip;
+                if (body_left == 0) {
+                    ++replies;
+                    state = Type;
+                }
+                continue;
+            }
+
+            char c = p[i++];
+            if (state == Type) {
+                kind = c;
+                negative = false;
+                len = 0;
+                if (kind == '-') ++errors;
+                state = Header;
+            } else if (c == '\n') {
+                if (kind == '$' && !negative) {
+                    body_left = len + 2;
+                    state = Body;
+                } else {
+                    ++replies;  // null bulk string or single-line reply
+                    state = Type;
+                }
+            } else if (kind == '$') {
+                if (c == '-') negative = true;
+                else if (c >= '0' && c <= '9') len = len * 10 + static_cast<uint64_t>(c - '0');
+            }
+        }
+        return replies;
+    }
+};
+
+/**
+ * Conn — per-socket pipeline state.
+ * `in_flight` counts commands written whose replies have not arrived yet.
+ */
+struct Conn {
+    socket_t     sock = SOCKET_INVALID;
+    int          in_flight = 0;
+    size_t       write_off = 0;     // bytes of `out` already sent
+    std::string  out{};             // queued command bytes
+    ReplyScanner scanner{};
+};
+
+/** strtol with a full-string check: rejects "abc", "80x" and out-of-range ports. */
+static bool parse_port(const char* text, uint16_t& out) {
+    char* end = nullptr;
+    long port = std::strtol(text, &end, 10);
+    if (end == text || *end != '\0' || port < 1 || port > 65535) return false;
+    out = static_cast<uint16_t>(port);
+    return true;
+}
+
+static bool resolve_address(const char* host, uint16_t port, sockaddr_in& out) {
+    addrinfo hints{};
+    hints.ai_family = AF_INET;
+    hints.ai_socktype = SOCK_STREAM;
+    addrinfo* res = nullptr;
+    if (getaddrinfo(host, nullptr, &hints, &res) != 0 || res == nullptr) return false;
+
+    out = *reinterpret_cast<sockaddr_in*>(res->ai_addr);
+    out.sin_port = htons(port);
+    freeaddrinfo(res);
+    return true;
+}
+
+static bool set_nonblocking(socket_t sock) {
+#ifdef _WIN32
+    u_long mode = 1;
+    return ioctlsocket(sock, FIONBIO, &mode) == 0;
+#else
+    int flags = fcntl(sock, F_GETFL, 0);
+    return flags >= 0 && fcntl(sock, F_SETFL, flags | O_NONBLOCK) == 0;
+#endif
+}
+
+static bool would_block() {
+#ifdef _WIN32
+    return WSAGetLastError() == WSAEWOULDBLOCK;
+#else
+    return errno == EAGAIN || errno == EWOULDBLOCK;
+#endif
+}
+
+/** Blocking connect, then switch to non-blocking for the storm. */
+static socket_t open_connection(const sockaddr_in& addr) {
+    socket_t sock = socket(AF_INET, SOCK_STREAM, IPPROTO_TCP);
+    if (sock == SOCKET_INVALID) return SOCKET_INVALID;
+
+    if (connect(sock, (const sockaddr*)&addr, sizeof(addr)) != 0) {
+        CLOSE_SOCKET(sock);
+        return SOCKET_INVALID;
+    }
+
+    int opt = 1;
+    setsockopt(sock, IPPROTO_TCP, TCP_NODELAY, reinterpret_cast<const char*>(&opt), sizeof(opt));
+    if (!set_nonblocking(sock)) {
+        CLOSE_SOCKET(sock);
+        return SOCKET_INVALID;
+    }
+    return sock;
+}
+
+int main(int argc, char* argv[]) {
+    const char* host = argc > 1 ? argv[1] : "127.0.0.1";
+    uint16_t port = 6399;
+    bool port_ok = argc <= 2 || parse_port(argv[2], port);
+    uint64_t total_ops = argc > 3 ? std::strtoull(argv[3], nullptr, 10) : 100000;
+    int n_conns = argc > 4 ? std::atoi(argv[4]) : 4;
+    std::string key = argc > 5 ? argv[5] : "hot_key";
+    int timeout_s = argc > 6 ? std::atoi(argv[6]) : 30;
+    if (!port_ok || total_ops == 0 || n_conns <= 0 || timeout_s <= 0) {
+        if (!port_ok) std::cerr << "Invalid port '" << argv[2] << "' (expected 1-65535)\n";
+        std::cerr << "Usage: bench_hot_key [host] [port] [total_ops] [connections] [key] [timeout_s]\n";
+        return 1;
+    }
+
+#ifdef _WIN32
+    WSADATA wsaData;
+    WSAStartup(MAKEWORD(2, 2), &wsaData);
+#endif
+
+    sockaddr_in addr{};
+    if (!resolve_address(host, port, addr)) {
+        std::cerr << "Cannot resolve " << host << "\n";
+        return 1;
+    }
+
+    std::vector<Conn> conns(static_cast<size_t>(n_conns));
+    for (auto& c : conns) {
+        c.sock = open_connection(addr);
+        if (c.sock == SOCKET_INVALID) {
+            std::cerr << "Cannot connect to " << host << ":" << port << "\n";
+            return 1;
+        }
+    }
+
+    // Seed the key so every GET returns a payload, then precompute a full
+    // pipeline's worth of GETs; refills send a prefix of it.
+    conns[0].out = RESPParser::encode_array({"SET", key, "storm"});
+    conns[0].in_flight = 1;
+    const std::string get_cmd = RESPParser::encode_array({"GET", key});
+    std::string burst;
+    burst.reserve(get_cmd.size() * kInFlightPerConn);
+    for (int i = 0; i < kInFlightPerConn; ++i) burst += get_cmd;
+
+    const uint64_t expected = total_ops + 1;  // + the seeding SET
+    uint64_t sent = 0, completed = 0, errors = 0;
+    std::vector<pollfd> pfds(conns.size());
+    char buf[16384];
+    bool failed = false, timed_out = false;
+
+    std::cout << "=== Hot-key storm: " << total_ops << " GET " << key << " over "
+              << n_conns << " connection(s), " << kInFlightPerConn
+              << " in flight each ===\n";
+    auto start = std::chrono::steady_clock::now();
+    // A server that stays connected but stops replying must not hang the run
+    auto deadline = start + std::chrono::seconds(timeout_s);
+
+    while (completed < expected && !failed) {
+        if (std::chrono::steady_clock::now() >= deadline) {
+            failed = timed_out = true;
+            break;
+        }
+        for (size_t i = 0; i < conns.size(); ++i) {
+            Conn& c = conns[i];
+            // Top the pipeline back up once the previous batch is written
+            if (c.write_off == c.out.size() && c.in_flight < kInFlightPerConn && sent < total_ops) {
+                uint64_t n = std::min<uint64_t>(kInFlightPerConn - c.in_flight, total_ops - sent);
+                c.out.assign(burst, 0, get_cmd.size() * n);
+                c.write_off = 0;
+                c.in_flight += static_cast<int>(n);
+                sent += n;
+            }
+            pfds[i].fd = c.sock;
+            pfds[i].events = POLLIN;
+            if (c.write_off < c.out.size()) pfds[i].events |= POLLOUT;
+            pfds[i].revents = 0;
+        }
+
+        if (POLL_FN(pfds.data(), static_cast<unsigned long>(pfds.size()), 1000) <= 0) continue;
+
+        for (size_t i = 0; i < conns.size() && !failed; ++i) {
+            Conn& c = conns[i];
+            short rev = pfds[i].revents;
+            if (rev & (POLLERR | POLLHUP | POLLNVAL)) {
+                failed = true;
+                break;
+            }
+            if (rev & POLLOUT) {
+                int n = send(c.sock, c.out.data() + c.write_off,
+                             static_cast<int>(c.out.size() - c.write_off), 0);
+                if (n > 0) c.write_off += static_cast<size_t>(n);
+                else if (!would_block()) failed = true;
+            }
+            if (rev & POLLIN) {
+                int n = recv(c.sock, buf, sizeof(buf), 0);
+                if (n <= 0) {
+                    if (n == 0 || !would_block()) failed = true;
+                    continue;
+                }
+                int replies = c.scanner.feed(buf, static_cast<size_t>(n), errors);
+                c.in_flight -= replies;
+                completed += static_cast<uint64_t>(replies);
+            }
+        }
+    }
+
+    auto elapsed = std::chrono::steady_clock::now() - start;
+    // Nanoseconds, not ms: a 100K-op storm finishes in tens of ms, so
+    // whole-ms truncation would skew ops/sec by several percent
+    uint64_t ns = static_cast<uint64_t>(
+        std::chrono::duration_cast<std::chrono::nanoseconds>(elapsed).count());
+
+    for (auto& c : conns) CLOSE_SOCKET(c.sock);
+#ifdef _WIN32
+    WSACleanup();
+#endif
+
+    uint64_t ops = completed > 0 ? completed - 1 : 0;
+    std::cout << "  ops:     " << ops << "\n"
+              << "  errors:  " << errors << "\n"
+              << "  elapsed: " << ns / 1000000 << "." << (ns / 1000) % 1000 / 100 << " ms\n"
+              << "  ops/sec: " << (ns > 0 ? ops * 1000000000ULL / ns : 0) << "\n";
+    if (timed_out) {
+        // `sent` excludes the seeding SET, which is always written first
+        std::cerr << "Timed out after " << timeout_s << " s: "
+                  << (sent + 1 - completed) << " in flight, "
+                  << (total_ops - sent) << " not yet sent.\n";
+    } else if (failed) {
+        std::cerr << "Connection lost before the storm completed.\n";
+    }
+    return (failed || errors > 0) ? 1 : 0;
+}
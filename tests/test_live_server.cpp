@@ -1,7 +1,8 @@
 /**
  * Live server integration test — connects over TCP and tests all commands.
  * Run the server first: distributed_cache.exe --port 6399
- * Then run this test:  test_live_server.exe
+ * Then run this test:  test_live_server.exe [host] [port]
+ * (defaults: 127.0.0.1 6399 — pass a different port to run suites side by side)
  */
 
 #ifdef _WIN32
@@ -17,7 +18,9 @@
 #else
     #include <sys/socket.h>
     #include <netinet/in.h>
+    #include <netinet/tcp.h>
     #include <arpa/inet.h>
+    #include <netdb.h>
     #include <unistd.h>
     using socket_t = int;
     #define SOCKET_INVALID (-1)
@@ -27,57 +30,213 @@
 #include <iostream>
 #include <string>
 #include <cstring>
+#include <cstdlib>
 #include <cassert>
 #include <vector>
 #include <chrono>
+#include <sstream>
+#include <thread>
+#include <random>
+#include <algorithm>
+
+#include "include/network/resp_parser.h"
+
+using dcs::network::RESPParser;
+
 // ── Helpers ───────────────────────────────────────────────────────────
 
-socket_t connect_to_server(const char* host, uint16_t port) {
+/**
+ * Connection — one keep-alive socket reused for every command.
+ * `pending` holds bytes received past the end of the last reply.
+ */
+struct Connection {
+    sockaddr_in addr{};  // resolved once, reused by every (re)connect
+    socket_t    sock = SOCKET_INVALID;
+    std::string pending{};
+};
+
+static void set_socket_option(socket_t sock, int level, int name) {
+    int opt = 1;
 #ifdef _WIN32
-    WSADATA wsa;
-    WSAStartup(MAKEWORD(2, 2), &wsa);
+    setsockopt(sock, level, name, reinterpret_cast<const char*>(&opt), sizeof(opt));
+#else
+    setsockopt(sock, level, name, &opt, sizeof(opt));
 #endif
+}
+
+/** strtol with a full-string check: rejects "abc", "80x" and out-of-range ports. */
+static bool parse_port(const char* text, uint16_t& out) {
+    char* end = nullptr;
+    long port = std::strtol(text, &end, 10);
+    if (end == text || *end != '\0' || port < 1 || port > 65535) return false;
+    out = static_cast<uint16_t>(port);
+    return true;
+}
+
+/** Resolve `host` once so reconnects skip the resolver entirely. */
+bool resolve_address(const char* host, uint16_t port, sockaddr_in& out) {
+    addrinfo hints{};
+    hints.ai_family = AF_INET;
+    hints.ai_socktype = SOCK_STREAM;
+    addrinfo* res = nullptr;
+    if (getaddrinfo(host, nullptr, &hints, &res) != 0 || res == nullptr) return false;
+
+    out = *reinterpret_cast<sockaddr_in*>(res->ai_addr);
+    out.sin_port = htons(port);
+    freeaddrinfo(res);
+    return true;
+}
+
+socket_t connect_to_server(const sockaddr_in& addr) {
     socket_t sock = socket(AF_INET, SOCK_STREAM, IPPROTO_TCP);
     if (sock == SOCKET_INVALID) return SOCKET_INVALID;
 
-    sockaddr_in addr{};
-    addr.sin_family = AF_INET;
-    addr.sin_port = htons(port);
-    addr.sin_addr.s_addr = inet_addr(host);
-
-    if (connect(sock, (sockaddr*)&addr, sizeof(addr)) != 0) {
+    if (connect(sock, (const sockaddr*)&addr, sizeof(addr)) != 0) {
         CLOSE_SOCKET(sock);
         return SOCKET_INVALID;
     }
+
+    // Small request/reply pairs: don't let Nagle hold back the next command
+    set_socket_option(sock, IPPROTO_TCP, TCP_NODELAY);
+    set_socket_option(sock, SOL_SOCKET, SO_KEEPALIVE);
     return sock;
 }
 
-std::string send_command(socket_t sock, const std::string& cmd) {
-    std::string full = cmd + "\r\n";
-    send(sock, full.c_str(), (int)full.size(), 0);
+/**
+ * Connect, retrying refused/failed attempts with truncated exponential
+ * backoff plus jitter so a server that is still starting isn't hammered.
+ */
+socket_t connect_with_retry(const sockaddr_in& addr, int max_attempts = 6,
+                            int base_ms = 50, int cap_ms = 2000) {
+    static std::mt19937 rng(std::random_device{}());
+    std::uniform_real_distribution<double> jitter(0.5, 1.5);
+
+    for (int attempt = 0; attempt < max_attempts; ++attempt) {
+        socket_t sock = connect_to_server(addr);
+        if (sock != SOCKET_INVALID) return sock;
+        if (attempt + 1 == max_attempts) break;
 
-    // Small delay for server to process
-#ifdef _WIN32
-    Sleep(50);
-#endif
+        int delay_ms = std::min(cap_ms, base_ms << attempt);
+        std::this_thread::sleep_for(std::chrono::milliseconds(
+            static_cast<int>(delay_ms * jitter(rng))));
+    }
+    return SOCKET_INVALID;
+}
+
+/**
+ * Returns the offset one past the end of the RESP reply starting at `pos`,
+ * or npos if the buffer does not yet hold the complete reply.
+ */
+size_t reply_end(const std::string& buf, size_t pos = 0) {
+    if (pos >= buf.size()) return std::string::npos;
+    auto crlf = buf.find("\r\n", pos);
+    if (crlf == std::string::npos) return std::string::npos;
+
+    size_t next = crlf + 2;
+    long n = std::atol(buf.c_str() + pos + 1);
+    if (buf[pos] == '$') {
+        if (n < 0) return next;  // null bulk string
+        size_t end = next + static_cast<size_t>(n) + 2;
+        return end <= buf.size() ? end : std::string::npos;
+    }
+    if (buf[pos] == '*') {
+        for (long i = 0; i < n && next != std::string::npos; ++i) {
+            next = reply_end(buf, next);
+        }
+    }
+    return next;  // +, -, : are single-line
+}
+
+/** Read exactly one reply; a single recv() can return a partial reply. */
+bool read_reply(Connection& conn, std::string& reply) {
+    char buf[4096];
+    size_t end;
+    while ((end = reply_end(conn.pending)) == std::string::npos) {
+        int n = static_cast<int>(recv(conn.sock, buf, sizeof(buf), 0));
+        if (n <= 0) return false;
+        conn.pending.append(buf, n);
+    }
+    reply = conn.pending.substr(0, end);
+    conn.pending.erase(0, end);
+    return true;
+}
+
+/** Split "SET k v" into arguments and frame them as a RESP array. */
+std::string encode_command(const std::string& cmd) {
+    std::vector<std::string> args;
+    std::istringstream iss(cmd);
+    std::string arg;
+    while (iss >> arg) args.push_back(arg);
+    return RESPParser::encode_array(args);
+}
+
+/** Send raw bytes in one write, then read `replies` replies. */
+std::vector<std::string> send_raw(Connection& conn, const std::string& bytes, size_t replies) {
+    std::vector<std::string> out;
+    if (send(conn.sock, bytes.c_str(), (int)bytes.size(), 0) != (int)bytes.size()) return out;
+    for (size_t i = 0; i < replies; ++i) {
+        std::string reply;
+        if (!read_reply(conn, reply)) break;
+        out.push_back(reply);
+    }
+    return out;
+}
 
-    char buf[4096] = {};
-    int n = recv(sock, buf, sizeof(buf) - 1, 0);
-    if (n <= 0) return "(disconnected)";
-    return std::string(buf, n);
+/** Send several commands in one write, then read one reply per command. */
+std::vector<std::string> send_pipeline(Connection& conn, const std::vector<std::string>& cmds) {
+    std::string batch;
+    for (auto& cmd : cmds) batch += encode_command(cmd);
+    return send_raw(conn, batch, cmds.size());
+}
+
+std::string send_command(Connection& conn, const std::string& cmd) {
+    std::string full = encode_command(cmd);
+
+    // Reuse the open socket; if the server dropped it, reconnect once and retry
+    for (int attempt = 0; attempt < 2; ++attempt) {
+        if (conn.sock == SOCKET_INVALID) {
+            conn.sock = connect_with_retry(conn.addr);
+            conn.pending.clear();
+            if (conn.sock == SOCKET_INVALID) break;
+        }
+
+        std::string reply;
+        int sent = static_cast<int>(send(conn.sock, full.c_str(), (int)full.size(), 0));
+        if (sent == (int)full.size() && read_reply(conn, reply)) return reply;
+
+        CLOSE_SOCKET(conn.sock);
+        conn.sock = SOCKET_INVALID;
+    }
+    return "(disconnected)";
 }
 
 // ── Tests ─────────────────────────────────────────────────────────────
 
-int main() {
+int main(int argc, char* argv[]) {
+    const char* host = (argc > 1) ? argv[1] : "127.0.0.1";
+    uint16_t port = 6399;
+    if (argc > 2 && !parse_port(argv[2], port)) {
+        std::cerr << "Invalid port '" << argv[2] << "' (expected 1-65535)\n"
+                  << "Usage: test_live_server [host] [port]\n";
+        return 1;
+    }
+
     std::cout << "========================================\n";
     std::cout << "  TEST SUITE 4: Live Server Integration \n";
     std::cout << "========================================\n\n";
 
-    socket_t sock = connect_to_server("127.0.0.1", 6399);
-    if (sock == SOCKET_INVALID) {
-        std::cerr << "[ERROR] Cannot connect to server on port 6399.\n";
-        std::cerr << "        Start the server first with: distributed_cache.exe --port 6399\n";
+#ifdef _WIN32
+    WSADATA wsa;
+    WSAStartup(MAKEWORD(2, 2), &wsa);
+#endif
+
+    Connection conn;
+    if (resolve_address(host, port, conn.addr)) {
+        conn.sock = connect_with_retry(conn.addr);
+    }
+    if (conn.sock == SOCKET_INVALID) {
+        std::cerr << "[ERROR] Cannot connect to server at " << host << ":" << port << ".\n";
+        std::cerr << "        Start the server first with: distributed_cache.exe --port " << port << "\n";
         return 1;
     }
 
@@ -114,75 +273,96 @@ int main() {
 
     // ── 1. PING ──────────────────────────────────────────────────
     std::cout << "--- PING Command ---\n";
-    check("PING returns PONG", send_command(sock, "PING"), "+PONG\r\n");
-    check("PING with message", send_command(sock, "PING hello"), "$5\r\nhello\r\n");
+    check("PING returns PONG", send_command(conn, "PING"), "+PONG\r\n");
+    check("PING with message", send_command(conn, "PING hello"), "$5\r\nhello\r\n");
 
     // ── 2. SET / GET ─────────────────────────────────────────────
     std::cout << "\n--- SET / GET Commands ---\n";
-    check("SET key returns OK", send_command(sock, "SET name Alice"), "+OK\r\n");
-    check("GET existing key", send_command(sock, "GET name"), "$5\r\nAlice\r\n");
-    check("SET another key", send_command(sock, "SET city NewYork"), "+OK\r\n");
-    check("GET another key", send_command(sock, "GET city"), "$7\r\nNewYork\r\n");
-    check("GET missing key returns nil", send_command(sock, "GET nonexistent"), "$-1\r\n");
+    check("SET key returns OK", send_command(conn, "SET name Alice"), "+OK\r\n");
+    check("GET existing key", send_command(conn, "GET name"), "$5\r\nAlice\r\n");
+    check("SET another key", send_command(conn, "SET city NewYork"), "+OK\r\n");
+    check("GET another key", send_command(conn, "GET city"), "$7\r\nNewYork\r\n");
+    check("GET missing key returns nil", send_command(conn, "GET nonexistent"), "$-1\r\n");
 
     // ── 3. UPDATE ────────────────────────────────────────────────
     std::cout << "\n--- UPDATE Existing Key ---\n";
-    check("SET overwrites value", send_command(sock, "SET name Bob"), "+OK\r\n");
-    check("GET returns updated value", send_command(sock, "GET name"), "$3\r\nBob\r\n");
+    check("SET overwrites value", send_command(conn, "SET name Bob"), "+OK\r\n");
+    check("GET returns updated value", send_command(conn, "GET name"), "$3\r\nBob\r\n");
 
     // ── 4. EXISTS ────────────────────────────────────────────────
     std::cout << "\n--- EXISTS Command ---\n";
-    check("EXISTS on present key", send_command(sock, "EXISTS name"), ":1\r\n");
-    check("EXISTS on missing key", send_command(sock, "EXISTS ghost"), ":0\r\n");
+    check("EXISTS on present key", send_command(conn, "EXISTS name"), ":1\r\n");
+    check("EXISTS on missing key", send_command(conn, "EXISTS ghost"), ":0\r\n");
 
     // ── 5. DEL ───────────────────────────────────────────────────
     std::cout << "\n--- DEL Command ---\n";
-    check("DEL existing key", send_command(sock, "DEL city"), ":1\r\n");
-    check("GET deleted key is nil", send_command(sock, "GET city"), "$-1\r\n");
-    check("DEL non-existing key", send_command(sock, "DEL ghost"), ":1\r\n");
+    check("DEL existing key", send_command(conn, "DEL city"), ":1\r\n");
+    check("GET deleted key is nil", send_command(conn, "GET city"), "$-1\r\n");
+    check("DEL non-existing key", send_command(conn, "DEL ghost"), ":1\r\n");
 
     // ── 6. Multiple keys ────────────────────────────────────────
     std::cout << "\n--- Bulk Operations ---\n";
-    send_command(sock, "SET k1 v1");
-    send_command(sock, "SET k2 v2");
-    send_command(sock, "SET k3 v3");
-    auto dbsize_resp = send_command(sock, "DBSIZE");
+    send_command(conn, "SET k1 v1");
+    send_command(conn, "SET k2 v2");
+    send_command(conn, "SET k3 v3");
+    auto dbsize_resp = send_command(conn, "DBSIZE");
     contains("DBSIZE returns integer", dbsize_resp, ":");
 
+    check("MSET batch returns OK", send_command(conn, "MSET m1 a m2 b m3 c"), "+OK\r\n");
+    check("GET key written by MSET", send_command(conn, "GET m3"), "$1\r\nc\r\n");
+
     // ── 7. KEYS ──────────────────────────────────────────────────
     std::cout << "\n--- KEYS Command ---\n";
-    auto keys_resp = send_command(sock, "KEYS *");
+    auto keys_resp = send_command(conn, "KEYS *");
     contains("KEYS returns array", keys_resp, "*");
     contains("KEYS contains name", keys_resp, "name");
 
     // ── 8. INFO ──────────────────────────────────────────────────
     std::cout << "\n--- INFO Command ---\n";
-    auto info_resp = send_command(sock, "INFO");
+    auto info_resp = send_command(conn, "INFO");
     contains("INFO has version", info_resp, "distributed_cache_version:1.0.0");
     contains("INFO has write_mode", info_resp, "write_mode:write-through");
     contains("INFO has cache_hits", info_resp, "cache_hits:");
 
     // ── 9. FLUSHALL ──────────────────────────────────────────────
     std::cout << "\n--- FLUSHALL Command ---\n";
-    check("FLUSHALL returns OK", send_command(sock, "FLUSHALL"), "+OK\r\n");
-    check("DBSIZE is 0 after flush", send_command(sock, "DBSIZE"), ":0\r\n");
+    check("FLUSHALL returns OK", send_command(conn, "FLUSHALL"), "+OK\r\n");
+    check("DBSIZE is 0 after flush", send_command(conn, "DBSIZE"), ":0\r\n");
 
     // ── 10. Persistence test ─────────────────────────────────────
     std::cout << "\n--- Persistence (Write-Through) ---\n";
-    check("SET persisted key", send_command(sock, "SET persist_key persist_val"), "+OK\r\n");
-    check("GET persisted key", send_command(sock, "GET persist_key"), "$11\r\npersist_val\r\n");
+    check("SET persisted key", send_command(conn, "SET persist_key persist_val"), "+OK\r\n");
+    check("GET persisted key", send_command(conn, "GET persist_key"), "$11\r\npersist_val\r\n");
+
+    // ── 11. Pipelining ───────────────────────────────────────────
+    std::cout << "\n--- Pipelining ---\n";
+    auto piped = send_pipeline(conn, {"SET pipe1 a", "SET pipe2 b", "GET pipe1", "GET pipe2"});
+    check("Pipeline returns one reply per command", std::to_string(piped.size()), "4");
+    if (piped.size() == 4) {
+        check("Pipelined SET", piped[1], "+OK\r\n");
+        check("Pipelined GET first key", piped[2], "$1\r\na\r\n");
+        check("Pipelined GET second key", piped[3], "$1\r\nb\r\n");
+    }
+
+    // ── 12. Inline protocol ──────────────────────────────────────
+    std::cout << "\n--- Inline Commands (telnet style) ---\n";
+    auto inline_resp = send_raw(conn, "SET inline_key v1\r\nGET inline_key\r\n", 2);
+    check("Inline commands return two replies", std::to_string(inline_resp.size()), "2");
+    if (inline_resp.size() == 2) {
+        check("Inline GET", inline_resp[1], "$2\r\nv1\r\n");
+    }
 
-    // ── 11. Error handling ───────────────────────────────────────
+    // ── 13. Error handling ───────────────────────────────────────
     std::cout << "\n--- Error Handling ---\n";
-    contains("Unknown command error", send_command(sock, "BADCMD"), "-ERR");
-    contains("GET wrong args error", send_command(sock, "GET"), "-ERR");
+    contains("Unknown command error", send_command(conn, "BADCMD"), "-ERR");
+    contains("GET wrong args error", send_command(conn, "GET"), "-ERR");
 
     // ── Summary ──────────────────────────────────────────────────
     std::cout << "\n========================================\n";
     std::cout << "Results: " << passed << " passed, " << failed << " failed.\n";
     std::cout << "========================================\n";
 
-    CLOSE_SOCKET(sock);
+    if (conn.sock != SOCKET_INVALID) CLOSE_SOCKET(conn.sock);
 #ifdef _WIN32
     WSACleanup();
 #endif